@@ -3,239 +3,301 @@
 CSV Header Analyzer
 
 This script reads CSV headers from a file and generates descriptive text
-for each header using an offline language model (DistilBERT).
+for each header using offline pattern-based analysis.
 """
 
 import csv
-import os
+import io
 import sys
-from typing import List, Dict
-from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
-import torch
+from functools import lru_cache
+from typing import List, Dict, Optional
 
+# Comprehensive patterns and their descriptions
+_PATTERNS: Dict[str, str] = {
+    # ID patterns
+    'invoice_id': 'unique transaction identifier',
+    'order_id': 'unique order identifier',
+    'customer_id': 'unique customer identifier',
+    'product_id': 'unique product identifier',
+    'user_id': 'unique user identifier',
+    'id': 'unique identifier',
+    
+    # Name patterns
+    'vendor_name': 'the supplier or vendor associated with the transaction',
+    'customer_name': 'the customer associated with the transaction',
+    'product_name': 'the name of the product',
+    'company_name': 'the name of the company',
+    'name': 'name or title information',
+    
+    # Financial patterns
+    'amount': 'monetary value of the transaction',
+    'price': 'price or cost of the item',
+    'total': 'total amount',
+    'subtotal': 'subtotal amount before taxes',
+    'tax': 'tax amount',
+    'discount': 'discount amount',
+    'cost': 'cost of the item or service',
+    'fee': 'fee amount',
+    'charge': 'charge amount',
+    
+    # Date patterns
+    'payment_date': 'date on which the payment was made',
+    'order_date': 'date when the order was placed',
+    'invoice_date': 'date when the invoice was created',
+    'due_date': 'date when payment is due',
+    'created_date': 'date when the record was created',
+    'updated_date': 'date when the record was last updated',
+    'date': 'date information',
+    
+    # Contact patterns
+    'email': 'email address',
+    'phone': 'phone number',
+    'address': 'address information',
+    'zip': 'postal code',
+    'city': 'city name',
+    'state': 'state or province',
+    'country': 'country name',
+    
+    # Status and type patterns
+    'status': 'current status of the record',
+    'type': 'category or type classification',
+    'category': 'category classification',
+    'description': 'detailed description of the item',
+    
+    # Business patterns
+    'vendor': 'supplier or vendor information',
+    'customer': 'customer information',
+    'payment': 'payment-related information',
+    'invoice': 'invoice or billing information',
+    'order': 'order information',
+    'product': 'product information',
+    'item': 'item information',
+    'service': 'service information',
+    
+    # Quantity patterns
+    'quantity': 'quantity or count',
+    'qty': 'quantity or count',
+    'count': 'count or number',
+    'number': 'numeric value',
+    
+    # Shipping patterns
+    'shipping': 'shipping information',
+    'billing': 'billing information',
+    'delivery': 'delivery information',
+}
 
-class CSVHeaderAnalyzer:
-    """
-    A class to analyze CSV headers and generate descriptive text using DistilBERT.
+
+class _RadixNode:
+    """A node of the compressed pattern trie; edges are keyed by first character."""
+    
+    __slots__ = ('label', 'children', 'description')
+    
+    def __init__(self, label: str, description: Optional[str] = None):
+        self.label = label
+        self.children: Dict[str, '_RadixNode'] = {}
+        self.description = description
+
+
+def _build_radix_tree() -> _RadixNode:
+    """Build a compressed (PATRICIA) trie of the partial-match patterns."""
+    root = _RadixNode('')
+    for pattern, description in _PATTERNS.items():
+        # Very short patterns are left to the exact-match lookup
+        if len(pattern) <= 2:
+            continue
+        node, key = root, pattern
+        while key:
+            child = node.children.get(key[0])
+            if child is None:
+                node.children[key[0]] = _RadixNode(key, description)
+                break
+            # Split the edge where the pattern diverges from its label
+            common = 0
+            limit = min(len(child.label), len(key))
+            while common < limit and child.label[common] == key[common]:
+                common += 1
+            if common < len(child.label):
+                split = _RadixNode(child.label[:common])
+                child.label = child.label[common:]
+                split.children[child.label[0]] = child
+                node.children[key[0]] = split
+                child = split
+            node, key = child, key[common:]
+        else:
+            node.description = description
+    return root
+
+
+_RADIX_TREE = _build_radix_tree()
+
+# Identifier suffixes checked in one str.endswith call
+_ID_SUFFIXES = ('_id', ' id')
+
+# Maps hyphens to underscores so both separators match the same patterns
+_NORMALIZE = str.maketrans('-', '_')
+
+# Upper bound on the bytes read for the header line
+_MAX_HEADER_BYTES = 1 << 16
+
+
+@lru_cache(maxsize=4096)
+def _describe(header_lower: str) -> str:
     """
+    Generate a description for an already lower-cased, normalized header.
+    Results are cached so repeated headers skip the pattern scan.
     
-    def __init__(self, model_name: str = "distilbert-base-uncased"):
-        """
-        Initialize the analyzer with a pre-trained model.
+    Args:
+        header_lower (str): The lower-cased header name, with hyphens
+            translated to underscores
         
-        Args:
-            model_name (str): Name of the Hugging Face model to use
-        """
-        self.model_name = model_name
-        self.classifier = None
-        self._load_model()
+    Returns:
+        str: Generated description
+    """
+    # Check for exact matches first (most specific)
+    description = _PATTERNS.get(header_lower)
+    if description is not None:
+        return description
     
-    def _load_model(self):
-        """Load the pre-trained model and tokenizer."""
-        try:
-            print(f"Loading model: {self.model_name}")
-            # For this use case, we'll use a pattern-based approach instead of a complex model
-            # This is more reliable and faster for CSV header analysis
-            print("Using pattern-based analysis for better reliability...")
-            self.classifier = None  # We'll use pattern matching instead
-        except Exception as e:
-            print(f"Error loading model: {e}")
-            print("Falling back to a simpler approach...")
-            self.classifier = None
+    # Check for partial matches by walking the radix tree from each position,
+    # one edge label at a time, keeping the longest (most specific) pattern
+    best = None
+    best_length = 0
+    header_length = len(header_lower)
+    for start in range(header_length):
+        if header_length - start <= best_length:
+            break  # No longer match can start here
+        node = _RADIX_TREE
+        position = start
+        while position < header_length:
+            node = node.children.get(header_lower[position])
+            if node is None or not header_lower.startswith(node.label, position):
+                break
+            position += len(node.label)
+            if node.description is not None and position - start > best_length:
+                best = node.description
+                best_length = position - start
+    if best is not None:
+        return best
     
-    def read_csv_headers(self, file_path: str) -> List[str]:
-        """
-        Read headers from a CSV file.
-        
-        Args:
-            file_path (str): Path to the CSV file
-            
-        Returns:
-            List[str]: List of header names
-        """
-        try:
-            with open(file_path, 'r', newline='', encoding='utf-8') as file:
-                reader = csv.reader(file)
-                headers = next(reader)
-                return [header.strip() for header in headers]
-        except FileNotFoundError:
-            print(f"Error: File '{file_path}' not found.")
-            return []
-        except Exception as e:
-            print(f"Error reading CSV file: {e}")
-            return []
+    # 'id' is too short for partial matching, but as a suffix it is unambiguous
+    if header_lower.endswith(_ID_SUFFIXES):
+        return _PATTERNS['id']
+    
+    # If no pattern matches, provide a generic description
+    clean_header = header_lower.replace('_', ' ')
+    return f"data field related to {clean_header}"
+
+
+def read_csv_headers(file_path: str) -> List[str]:
+    """
+    Read headers from a CSV file.
     
-    def generate_description_simple(self, header: str) -> str:
-        """
-        Generate a simple description based on common patterns.
-        This method uses intelligent pattern matching for reliable results.
+    Args:
+        file_path (str): Path to the CSV file
         
-        Args:
-            header (str): The header name to describe
-            
-        Returns:
-            str: Generated description
-        """
-        header_lower = header.lower()
+    Returns:
+        List[str]: List of non-empty header names
+    """
+    try:
+        # Only the header row is needed, so read at most _MAX_HEADER_BYTES in
+        # binary mode; a buffer the size of that bound fetches it with a
+        # single read
+        with open(file_path, 'rb', buffering=_MAX_HEADER_BYTES) as file:
+            data = file.read(_MAX_HEADER_BYTES)
+            capped = len(data) == _MAX_HEADER_BYTES and file.read(1) != b''
         
-        # Comprehensive patterns and their descriptions
-        patterns = {
-            # ID patterns
-            'invoice_id': 'unique transaction identifier',
-            'order_id': 'unique order identifier',
-            'customer_id': 'unique customer identifier',
-            'product_id': 'unique product identifier',
-            'user_id': 'unique user identifier',
-            'id': 'unique identifier',
-            
-            # Name patterns
-            'vendor_name': 'the supplier or vendor associated with the transaction',
-            'customer_name': 'the customer associated with the transaction',
-            'product_name': 'the name of the product',
-            'company_name': 'the name of the company',
-            'name': 'name or title information',
-            
-            # Financial patterns
-            'amount': 'monetary value of the transaction',
-            'price': 'price or cost of the item',
-            'total': 'total amount',
-            'subtotal': 'subtotal amount before taxes',
-            'tax': 'tax amount',
-            'discount': 'discount amount',
-            'cost': 'cost of the item or service',
-            'fee': 'fee amount',
-            'charge': 'charge amount',
-            
-            # Date patterns
-            'payment_date': 'date on which the payment was made',
-            'order_date': 'date when the order was placed',
-            'invoice_date': 'date when the invoice was created',
-            'due_date': 'date when payment is due',
-            'created_date': 'date when the record was created',
-            'updated_date': 'date when the record was last updated',
-            'date': 'date information',
-            
-            # Contact patterns
-            'email': 'email address',
-            'phone': 'phone number',
-            'address': 'address information',
-            'zip': 'postal code',
-            'city': 'city name',
-            'state': 'state or province',
-            'country': 'country name',
-            
-            # Status and type patterns
-            'status': 'current status of the record',
-            'type': 'category or type classification',
-            'category': 'category classification',
-            'description': 'detailed description of the item',
-            
-            # Business patterns
-            'vendor': 'supplier or vendor information',
-            'customer': 'customer information',
-            'payment': 'payment-related information',
-            'invoice': 'invoice or billing information',
-            'order': 'order information',
-            'product': 'product information',
-            'item': 'item information',
-            'service': 'service information',
-            
-            # Quantity patterns
-            'quantity': 'quantity or count',
-            'qty': 'quantity or count',
-            'count': 'count or number',
-            'number': 'numeric value',
-            
-            # Shipping patterns
-            'shipping': 'shipping information',
-            'billing': 'billing information',
-            'delivery': 'delivery information',
-        }
+        # Let csv.reader pull lines from the bounded stream so quoted fields
+        # spanning several lines are parsed as one header row
+        text = io.TextIOWrapper(io.BytesIO(data), encoding='utf-8', errors='replace', newline='')
+        last_line = ''
+        exhausted = False
         
-        # Check for exact matches first (most specific)
-        if header_lower in patterns:
-            return patterns[header_lower]
+        def lines():
+            nonlocal last_line, exhausted
+            for last_line in text:
+                yield last_line
+            exhausted = True
         
-        # Check for partial matches (less specific but still good)
-        for pattern, description in patterns.items():
-            if pattern in header_lower and len(pattern) > 2:  # Avoid very short matches
-                return description
+        headers = next(csv.reader(lines()), [])
         
-        # If no pattern matches, provide a generic description
-        clean_header = header_lower.replace('_', ' ').replace('-', ' ')
-        return f"data field related to {clean_header}"
-    
-    def generate_description_with_model(self, header: str) -> str:
-        """
-        Generate description using pattern-based analysis.
-        This method provides reliable and accurate descriptions.
+        # A row that runs into the byte bound without a line ending, or that
+        # needed more lines than the bound held (an open quoted field), was
+        # cut off, possibly in the middle of a column name or character
+        if capped and (exhausted or not last_line.endswith(('\n', '\r'))):
+            raise ValueError(f"header row exceeds {_MAX_HEADER_BYTES} bytes")
         
-        Args:
-            header (str): The header name to describe
-            
-        Returns:
-            str: Generated description
-        """
-        # Use the improved pattern-based approach for better reliability
-        return self.generate_description_simple(header)
+        # Strip and drop empty headers in a single pass
+        return [header for header in map(str.strip, headers) if header]
+    except FileNotFoundError:
+        print(f"Error: File '{file_path}' not found.")
+        return []
+    except Exception as e:
+        print(f"Error reading CSV file: {e}")
+        return []
+
+
+def describe(header: str) -> str:
+    """
+    Generate a description for a header based on common patterns.
     
-    def analyze_headers(self, headers: List[str]) -> Dict[str, str]:
-        """
-        Analyze a list of headers and generate descriptions.
-        
-        Args:
-            headers (List[str]): List of header names
-            
-        Returns:
-            Dict[str, str]: Dictionary mapping headers to descriptions
-        """
-        results = {}
-        
-        for header in headers:
-            if header:  # Skip empty headers
-                description = self.generate_description_with_model(header)
-                results[header] = description
+    Args:
+        header (str): The header name to describe
         
-        return results
+    Returns:
+        str: Generated description
+    """
+    return _describe(header.lower().translate(_NORMALIZE))
+
+
+def analyze(headers: List[str]) -> Dict[str, str]:
+    """
+    Analyze a list of headers and generate descriptions.
     
-    def print_results(self, results: Dict[str, str]):
-        """
-        Print results to console.
+    Args:
+        headers (List[str]): List of non-empty header names
         
-        Args:
-            results (Dict[str, str]): Dictionary of header descriptions
-        """
-        print("\n" + "="*60)
-        print("CSV HEADER ANALYSIS RESULTS")
-        print("="*60)
+    Returns:
+        Dict[str, str]: Dictionary mapping headers to descriptions
+    """
+    normalized = [header.lower().translate(_NORMALIZE) for header in headers]
+    return dict(zip(headers, map(_describe, normalized)))
+
+
+def print_results(results: Dict[str, str]):
+    """
+    Print results to console.
+    
+    Args:
+        results (Dict[str, str]): Dictionary of header descriptions
+    """
+    rule = "="*60 + "\n"
+    lines = "".join(f"{header} → {description}\n" for header, description in results.items())
+    
+    # One write instead of a print() per line
+    sys.stdout.write("\n" + rule + "CSV HEADER ANALYSIS RESULTS\n" + rule + lines + rule)
+
+
+def save_results(results: Dict[str, str], output_file: str = "output.txt"):
+    """
+    Save results to a text file.
+    
+    Args:
+        results (Dict[str, str]): Dictionary of header descriptions
+        output_file (str): Output file path
+    """
+    try:
+        buffer = io.StringIO()
+        buffer.write("CSV Header Analysis Results\n" + "="*40 + "\n\n")
+        buffer.writelines(f"{header} → {description}\n" for header, description in results.items())
+        buffer.write("\nGenerated by CSV Header Analyzer\n")
         
-        for header, description in results.items():
-            print(f"{header} → {description}")
+        with open(output_file, 'w', encoding='utf-8') as file:
+            file.write(buffer.getvalue())
         
-        print("="*60)
-    
-    def save_results(self, results: Dict[str, str], output_file: str = "output.txt"):
-        """
-        Save results to a text file.
+        print(f"\nResults saved to: {output_file}")
         
-        Args:
-            results (Dict[str, str]): Dictionary of header descriptions
-            output_file (str): Output file path
-        """
-        try:
-            with open(output_file, 'w', encoding='utf-8') as file:
-                file.write("CSV Header Analysis Results\n")
-                file.write("="*40 + "\n\n")
-                
-                for header, description in results.items():
-                    file.write(f"{header} → {description}\n")
-                
-                file.write(f"\nGenerated by CSV Header Analyzer\n")
-            
-            print(f"\nResults saved to: {output_file}")
-            
-        except Exception as e:
-            print(f"Error saving results to file: {e}")
+    except Exception as e:
+        print(f"Error saving results to file: {e}")
 
 
 def main():
@@ -249,18 +311,9 @@ def main():
     
     csv_file = sys.argv[1]
     
-    # Check if file exists
-    if not os.path.exists(csv_file):
-        print(f"Error: File '{csv_file}' does not exist.")
-        sys.exit(1)
-    
-    # Initialize analyzer
-    print("Initializing CSV Header Analyzer...")
-    analyzer = CSVHeaderAnalyzer()
-    
-    # Read headers from CSV file
+    # Read headers from CSV file; a missing file is reported by read_csv_headers
     print(f"Reading headers from: {csv_file}")
-    headers = analyzer.read_csv_headers(csv_file)
+    headers = read_csv_headers(csv_file)
     
     if not headers:
         print("No headers found or error reading file.")
@@ -270,13 +323,13 @@ def main():
     
     # Analyze headers
     print("Analyzing headers...")
-    results = analyzer.analyze_headers(headers)
+    results = analyze(headers)
     
     # Display results
-    analyzer.print_results(results)
+    print_results(results)
     
     # Save results to file
-    analyzer.save_results(results)
+    save_results(results)
     
     print("\nAnalysis complete!")
 